@@ -2,15 +2,32 @@ import argparse
 import json
 import os
 import struct
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # ----------------------------------------------------------------------------------------------------------------------
 # File helper functions to read and write binary or JSON data.
 # ----------------------------------------------------------------------------------------------------------------------
-def read_bin_file(file_path: str) -> bytearray:
+__CREATED_DIRS__ = set()
+
+
+def create_parent_dirs(file_path: str):
+    # Directories that were already created during this run don't need to be checked again
+    dir_path = os.path.dirname(file_path)
+
+    if dir_path and dir_path not in __CREATED_DIRS__:
+        os.makedirs(dir_path, exist_ok=True)
+        __CREATED_DIRS__.add(dir_path)
+
+
+def read_bin_file(file_path: str) -> bytes:
     with open(file_path, "rb") as f:
-        ret = f.read()
-    return bytearray(ret)
+        return f.read()
 
 
 def write_bin_file(file_path: str, buffer):
@@ -18,8 +35,7 @@ def write_bin_file(file_path: str, buffer):
         raise ValueError("Tried to write non-existent data to file.")
 
     # Try to create parent directories if necessary
-    if file_path.find("/") != -1:
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    create_parent_dirs(file_path)
 
     with open(file_path, "wb") as f:
         f.write(buffer)
@@ -27,6 +43,10 @@ def write_bin_file(file_path: str, buffer):
 
 
 def read_json_file(file_path: str):
+    if orjson is not None:
+        with open(file_path, "rb") as f:
+            return orjson.loads(f.read())
+
     with open(file_path, "r", encoding="utf-8") as f:
         data = json.load(f)
     return data
@@ -34,12 +54,18 @@ def read_json_file(file_path: str):
 
 def write_json_file(file_path: str, data, encoder=json.JSONEncoder):
     # Try to create parent directories if necessary
-    if file_path.find("/") != -1:
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    create_parent_dirs(file_path)
+
+    # orjson is a lot faster, but it only supports its own serialization. Custom encoders still need to use json.
+    if orjson is not None and encoder is json.JSONEncoder:
+        with open(file_path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
 
+    # Stream the encoded chunks to the file instead of building the whole string in memory first
     with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4, ensure_ascii=False, cls=encoder)
-        f.flush()
+        for chunk in encoder(indent=4, separators=(",", ": "), ensure_ascii=False).iterencode(data):
+            f.write(chunk)
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -60,7 +86,35 @@ def write_json_file(file_path: str, data, encoder=json.JSONEncoder):
 # evolution_types | All available evolution condition types
 # genders         | Gender types for icon list
 # ----------------------------------------------------------------------------------------------------------------------
-__CONSTANTS__ = read_json_file("constants.json")
+class _LazyConstants:
+    # The constants file is only parsed once a category is actually accessed
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.categories = None
+
+    def __getitem__(self, category: str) -> list:
+        if self.categories is None:
+            self.categories = read_json_file(self.file_path)
+        return self.categories[category]
+
+
+class _LazyConstantsIndex:
+    # Reverse lookup tables so that names can be converted back to their values without scanning the lists. These are
+    # built separately for each category when they are needed first.
+    def __init__(self, constants: _LazyConstants):
+        self.constants = constants
+        self.indices = dict()
+
+    def __getitem__(self, category: str) -> dict:
+        indices = self.indices.get(category)
+        if indices is None:
+            indices = {cname: cval for cval, cname in enumerate(self.constants[category])}
+            self.indices[category] = indices
+        return indices
+
+
+__CONSTANTS__ = _LazyConstants("constants.json")
+__CONSTANTS_IDX__ = _LazyConstantsIndex(__CONSTANTS__)
 
 
 def cnstname(category: str, cval: int) -> str:
@@ -68,7 +122,7 @@ def cnstname(category: str, cval: int) -> str:
 
 
 def cnstval(category: str, cname: str) -> int:
-    return __CONSTANTS__[category].index(cname)
+    return __CONSTANTS_IDX__[category][cname]
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -79,119 +133,154 @@ __BLANK_PRSNL_ENTRY__ = bytes.fromhex("000000000000000000000000000000000000FF000
                                       "000000000000000000000000000000000000010001000100010001000000000000000000000000"
                                       "000000000000000000000000000001010101010101010101010101010100000000000000000000"
                                       "0000000000000000000000000000000000000000")
-__PERSONAL_ENTRY_STRUCT__ = struct.Struct("<10B4H6B4H2B3H16s4s16sI8H72s4s2H")
+__PERSONAL_ENTRY_STRUCT__ = struct.Struct("<10B4H6B4H2B3H2QI2QI8H72sI2H")
+
+
+# Many Pokémon share the same unknown data, so the decoded bytes are cached
+@lru_cache(maxsize=None)
+def hex_to_bytes(hex_string: str) -> bytes:
+    return bytes.fromhex(hex_string)
 
 
 def unpack_personal(in_file: str, out_file: str) -> None:
     buffer = read_bin_file(in_file)
     len_buffer = len(buffer)
 
+    # Bind the constant tables to locals since they are accessed many times for every entry
+    pokemon = __CONSTANTS__["pokemon"]
+    moves = __CONSTANTS__["moves"]
+    types = __CONSTANTS__["types"]
+    abilities = __CONSTANTS__["abilities"]
+    items = __CONSTANTS__["items"]
+    egg_groups = __CONSTANTS__["egg_groups"]
+    growth_types = __CONSTANTS__["growth_types"]
+    dex_colors = __CONSTANTS__["dex_colors"]
+
+    # TMs/TRs/etc. learnsets are stored as bitflags. Only the set bits are visited, starting with the lowest one.
+    def parse_learnset_bits(consts_name: str, flags: int) -> list:
+        names = __CONSTANTS__[consts_name]
+        moves_list = list()
+
+        while flags:
+            bit = flags & -flags
+            index = bit.bit_length() - 1
+            if index >= len(names):
+                break
+            moves_list.append(names[index])
+            flags ^= bit
+
+        return moves_list
+
     entries = dict()
 
-    for i in range(len_buffer // 0xB0):
-        entry = dict()
-        offset = i * 0xB0
+    # Unpack all binary entries at once. Any trailing bytes that do not form a complete entry are ignored
+    entries_data = __PERSONAL_ENTRY_STRUCT__.iter_unpack(memoryview(buffer)[:len_buffer - len_buffer % 0xB0])
 
-        # Unpack binary entry data
+    for i, entry_data in enumerate(entries_data):
         base_hp, base_atk, base_def, base_spd, base_sp_atk, base_sp_def, type_1, type_2, catch_rate, evolution_stage,\
         ev_yield, common_item, rare_item, very_rare_item, gender_rate, hatch_cycles, base_friendship, growth_type,\
         egg_group_1, egg_group_2, ability_1, ability_2, hidden_ability, first_form_index, form_count, pokedex_bits,\
-        base_exp, height, weight, tm_bits, move_tutors_bits, tr_bits, icon_id, special_z_item, special_z_base_move,\
-        special_z_move, egg_species, egg_form, special_species_flags, pokedex_number, unk5E, unk60, armor_tutors_bits,\
-        armor_dex_number, crown_dex_number = __PERSONAL_ENTRY_STRUCT__.unpack_from(buffer, offset)
+        base_exp, height, weight, tm_bits_lo, tm_bits_hi, move_tutors_bits, tr_bits_lo, tr_bits_hi, icon_id,\
+        special_z_item, special_z_base_move, special_z_move, egg_species, egg_form, special_species_flags,\
+        pokedex_number, unk5E, unk60, armor_tutors_bits, armor_dex_number, crown_dex_number = entry_data
 
         # Create JSON entry from unpacked data. The order was chosen to put related elements closer to each other
-        entry["type_1"] = cnstname("types", type_1)
-        entry["type_2"] = cnstname("types", type_2)
-        entry["base_hp"] = base_hp
-        entry["base_atk"] = base_atk
-        entry["base_def"] = base_def
-        entry["base_sp_atk"] = base_sp_atk
-        entry["base_sp_def"] = base_sp_def
-        entry["base_spd"] = base_spd
-        entry["ability_1"] = cnstname("abilities", ability_1)
-        entry["ability_2"] = cnstname("abilities", ability_2)
-        entry["hidden_ability"] = cnstname("abilities", hidden_ability)
-        entry["height"] = height
-        entry["weight"] = weight
-        entry["evs_hp"] = ev_yield & 3
-        entry["evs_atk"] = (ev_yield >> 2) & 3
-        entry["evs_def"] = (ev_yield >> 4) & 3
-        entry["evs_sp_atk"] = (ev_yield >> 8) & 3
-        entry["evs_sp_def"] = (ev_yield >> 10) & 3
-        entry["evs_spd"] = (ev_yield >> 6) & 3
-        entry["fail_telekinesis"] = bool((ev_yield >> 12) & 3)
-        entry["catch_rate"] = catch_rate
-        entry["gender_rate"] = gender_rate
-        entry["base_exp"] = base_exp
-        entry["growth_type"] = cnstname("growth_types", growth_type)
-        entry["special_z_item"] = cnstname("items", special_z_item)
-        entry["special_z_base_move"] = cnstname("moves", special_z_base_move)
-        entry["special_z_move"] = cnstname("moves", special_z_move)
-        entry["egg_group_1"] = cnstname("egg_groups", egg_group_1)
-        entry["egg_group_2"] = cnstname("egg_groups", egg_group_2)
-        entry["evolution_stage"] = evolution_stage
-        entry["egg_species"] = cnstname("pokemon", egg_species)
-        entry["egg_form"] = egg_form
-        entry["hatch_cycles"] = hatch_cycles
-        entry["base_friendship"] = base_friendship
-        entry["common_item"] = cnstname("items", common_item)
-        entry["rare_item"] = cnstname("items", rare_item)
-        entry["very_rare_item"] = cnstname("items", very_rare_item)
-        entry["first_form_index"] = cnstname("pokemon", first_form_index)
-        entry["form_count"] = form_count
-        entry["icon_id"] = icon_id
-        entry["pokedex_number"] = pokedex_number
-        entry["armor_dex_number"] = armor_dex_number
-        entry["crown_dex_number"] = crown_dex_number
-        entry["dex_color"] = cnstname("dex_colors", pokedex_bits & 0x3F)
-        entry["has_dex_entry"] = bool(pokedex_bits & 0x40)
-        entry["is_visual_form"] = bool(pokedex_bits & 0x80)
-        entry["is_regional_form"] = bool(special_species_flags & 0x1)
-        entry["can_not_dynamax"] = bool(special_species_flags & 0x4)
-        entry["tms"] = list()
-        entry["trs"] = list()
-        entry["move_tutors"] = list()
-        entry["armor_tutors"] = list()
-        entry["unk5E"] = unk5E
-        entry["unk60"] = unk60.hex()
-
-        # TMs/TRs/etc. learnsets are stored as bitflags. We'll have to unpack those first
-        def parse_learnset_bits(consts_name: str, bits: bytes):
-            for index, move in enumerate(__CONSTANTS__[consts_name]):
-                if bits[index >> 3] & (1 << (index & 7)):
-                    entry[consts_name].append(move)
-
-        parse_learnset_bits("tms", tm_bits)
-        parse_learnset_bits("trs", tr_bits)
-        parse_learnset_bits("move_tutors", move_tutors_bits)
-        parse_learnset_bits("armor_tutors", armor_tutors_bits)
-
-        entries[cnstname("pokemon", i)] = entry
+        entry = {
+            "type_1": types[type_1],
+            "type_2": types[type_2],
+            "base_hp": base_hp,
+            "base_atk": base_atk,
+            "base_def": base_def,
+            "base_sp_atk": base_sp_atk,
+            "base_sp_def": base_sp_def,
+            "base_spd": base_spd,
+            "ability_1": abilities[ability_1],
+            "ability_2": abilities[ability_2],
+            "hidden_ability": abilities[hidden_ability],
+            "height": height,
+            "weight": weight,
+            "evs_hp": ev_yield & 3,
+            "evs_atk": (ev_yield >> 2) & 3,
+            "evs_def": (ev_yield >> 4) & 3,
+            "evs_sp_atk": (ev_yield >> 8) & 3,
+            "evs_sp_def": (ev_yield >> 10) & 3,
+            "evs_spd": (ev_yield >> 6) & 3,
+            "fail_telekinesis": bool((ev_yield >> 12) & 3),
+            "catch_rate": catch_rate,
+            "gender_rate": gender_rate,
+            "base_exp": base_exp,
+            "growth_type": growth_types[growth_type],
+            "special_z_item": items[special_z_item],
+            "special_z_base_move": moves[special_z_base_move],
+            "special_z_move": moves[special_z_move],
+            "egg_group_1": egg_groups[egg_group_1],
+            "egg_group_2": egg_groups[egg_group_2],
+            "evolution_stage": evolution_stage,
+            "egg_species": pokemon[egg_species],
+            "egg_form": egg_form,
+            "hatch_cycles": hatch_cycles,
+            "base_friendship": base_friendship,
+            "common_item": items[common_item],
+            "rare_item": items[rare_item],
+            "very_rare_item": items[very_rare_item],
+            "first_form_index": pokemon[first_form_index],
+            "form_count": form_count,
+            "icon_id": icon_id,
+            "pokedex_number": pokedex_number,
+            "armor_dex_number": armor_dex_number,
+            "crown_dex_number": crown_dex_number,
+            "dex_color": dex_colors[pokedex_bits & 0x3F],
+            "has_dex_entry": bool(pokedex_bits & 0x40),
+            "is_visual_form": bool(pokedex_bits & 0x80),
+            "is_regional_form": bool(special_species_flags & 0x1),
+            "can_not_dynamax": bool(special_species_flags & 0x4),
+            "tms": parse_learnset_bits("tms", tm_bits_lo | (tm_bits_hi << 64)),
+            "trs": parse_learnset_bits("trs", tr_bits_lo | (tr_bits_hi << 64)),
+            "move_tutors": parse_learnset_bits("move_tutors", move_tutors_bits),
+            "armor_tutors": parse_learnset_bits("armor_tutors", armor_tutors_bits),
+            "unk5E": unk5E,
+            "unk60": unk60.hex()
+        }
+
+        entries[pokemon[i]] = entry
 
     write_json_file(out_file, entries)
 
 
 def pack_personal(in_file: str, out_file: str) -> None:
     entries = read_json_file(in_file)
-    buffer = bytearray(len(__CONSTANTS__["pokemon"]) * __BLANK_PRSNL_ENTRY__)
+
+    # Bind the reverse lookup tables to locals since they are accessed many times for every entry
+    pokemon_idx = __CONSTANTS_IDX__["pokemon"]
+    moves_idx = __CONSTANTS_IDX__["moves"]
+    types_idx = __CONSTANTS_IDX__["types"]
+    abilities_idx = __CONSTANTS_IDX__["abilities"]
+    items_idx = __CONSTANTS_IDX__["items"]
+    egg_groups_idx = __CONSTANTS_IDX__["egg_groups"]
+    growth_types_idx = __CONSTANTS_IDX__["growth_types"]
+    dex_colors_idx = __CONSTANTS_IDX__["dex_colors"]
+
+    # Pokémon missing from the JSON file keep the blank entry, so the template is still required here
+    buffer = bytearray(__BLANK_PRSNL_ENTRY__) * len(pokemon_idx)
     offset = 0
 
+    # The learnset bitflags are packed into a single integer for each learnset
+    def pack_learnset_bits(entry: dict, consts_name: str) -> int:
+        indices = __CONSTANTS_IDX__[consts_name]
+        flags = 0
+        for move in entry[consts_name]:
+            if move in indices:
+                flags |= 1 << indices[move]
+        return flags
+
     for pokemon_name, entry in entries.items():
-        def pack_learnset_bits(consts_name: str, size: int):
-            bits = bytearray(size)
-            for index, move in enumerate(__CONSTANTS__[consts_name]):
-                if move in entry[consts_name]:
-                    bits[index >> 3] |= 1 << (index & 7)
-            return bits
-
-        tm_bits = pack_learnset_bits("tms", 16)
-        move_tutors_bits = pack_learnset_bits("move_tutors", 4)
-        tr_bits = pack_learnset_bits("trs", 16)
-        armor_tutors_bits = pack_learnset_bits("armor_tutors", 4)
-
-        type_1 = cnstval("types", entry["type_1"])
-        type_2 = cnstval("types", entry["type_2"])
+        tm_bits = pack_learnset_bits(entry, "tms")
+        move_tutors_bits = pack_learnset_bits(entry, "move_tutors")
+        tr_bits = pack_learnset_bits(entry, "trs")
+        armor_tutors_bits = pack_learnset_bits(entry, "armor_tutors")
+
+        type_1 = types_idx[entry["type_1"]]
+        type_2 = types_idx[entry["type_2"]]
         ev_yield = entry["evs_hp"] & 3
         ev_yield |= (entry["evs_atk"] & 3) << 2
         ev_yield |= (entry["evs_def"] & 3) << 4
@@ -199,38 +288,40 @@ def pack_personal(in_file: str, out_file: str) -> None:
         ev_yield |= (entry["evs_sp_atk"] & 3) << 8
         ev_yield |= (entry["evs_sp_def"] & 3) << 10
         ev_yield |= (1 if entry["fail_telekinesis"] else 0) << 12
-        common_item = cnstval("items", entry["common_item"])
-        rare_item = cnstval("items", entry["rare_item"])
-        very_rare_item = cnstval("items", entry["very_rare_item"])
-        growth_type = cnstval("growth_types", entry["growth_type"])
-        egg_group_1 = cnstval("egg_groups", entry["egg_group_1"])
-        egg_group_2 = cnstval("egg_groups", entry["egg_group_2"])
-        ability_1 = cnstval("abilities", entry["ability_1"])
-        ability_2 = cnstval("abilities", entry["ability_2"])
-        hidden_ability = cnstval("abilities", entry["hidden_ability"])
-        first_form_index = cnstval("pokemon", entry["first_form_index"])
-        pokedex_bits = cnstval("dex_colors", entry["dex_color"])
+        common_item = items_idx[entry["common_item"]]
+        rare_item = items_idx[entry["rare_item"]]
+        very_rare_item = items_idx[entry["very_rare_item"]]
+        growth_type = growth_types_idx[entry["growth_type"]]
+        egg_group_1 = egg_groups_idx[entry["egg_group_1"]]
+        egg_group_2 = egg_groups_idx[entry["egg_group_2"]]
+        ability_1 = abilities_idx[entry["ability_1"]]
+        ability_2 = abilities_idx[entry["ability_2"]]
+        hidden_ability = abilities_idx[entry["hidden_ability"]]
+        first_form_index = pokemon_idx[entry["first_form_index"]]
+        pokedex_bits = dex_colors_idx[entry["dex_color"]]
         pokedex_bits |= 0x40 if entry["has_dex_entry"] else 0
         pokedex_bits |= 0x80 if entry["is_visual_form"] else 0
-        special_z_item = cnstval("items", entry["special_z_item"])
-        special_z_base_move = cnstval("moves", entry["special_z_base_move"])
-        special_z_move = cnstval("moves", entry["special_z_move"])
-        egg_species = cnstval("pokemon", entry["egg_species"])
+        special_z_item = items_idx[entry["special_z_item"]]
+        special_z_base_move = moves_idx[entry["special_z_base_move"]]
+        special_z_move = moves_idx[entry["special_z_move"]]
+        egg_species = pokemon_idx[entry["egg_species"]]
         special_species_flags = 1 if entry["is_regional_form"] else 0
         special_species_flags |= 4 if entry["can_not_dynamax"] else 0
 
+        # The 128-bit TM and TR flags are split into two 64-bit halves
         __PERSONAL_ENTRY_STRUCT__.pack_into(buffer, offset, entry["base_hp"], entry["base_atk"], entry["base_def"],
                                             entry["base_spd"], entry["base_sp_atk"], entry["base_sp_def"], type_1,
                                             type_2, entry["catch_rate"], entry["evolution_stage"], ev_yield, common_item,
                                             rare_item, very_rare_item, entry["gender_rate"], entry["hatch_cycles"],
                                             entry["base_friendship"], growth_type, egg_group_1, egg_group_2, ability_1,
                                             ability_2, hidden_ability, first_form_index, entry["form_count"],
-                                            pokedex_bits, entry["base_exp"], entry["height"], entry["weight"], tm_bits,
-                                            move_tutors_bits, tr_bits, entry["icon_id"], special_z_item,
-                                            special_z_base_move, special_z_move, egg_species, entry["egg_form"],
-                                            special_species_flags, entry["pokedex_number"], entry["unk5E"],
-                                            bytes.fromhex(entry["unk60"]), armor_tutors_bits, entry["armor_dex_number"],
-                                            entry["crown_dex_number"])
+                                            pokedex_bits, entry["base_exp"], entry["height"], entry["weight"],
+                                            tm_bits & 0xFFFFFFFFFFFFFFFF, tm_bits >> 64, move_tutors_bits,
+                                            tr_bits & 0xFFFFFFFFFFFFFFFF, tr_bits >> 64, entry["icon_id"],
+                                            special_z_item, special_z_base_move, special_z_move, egg_species,
+                                            entry["egg_form"], special_species_flags, entry["pokedex_number"],
+                                            entry["unk5E"], hex_to_bytes(entry["unk60"]), armor_tutors_bits,
+                                            entry["armor_dex_number"], entry["crown_dex_number"])
         offset += 0xB0
 
     write_bin_file(out_file, buffer)
@@ -239,46 +330,57 @@ def pack_personal(in_file: str, out_file: str) -> None:
 # ----------------------------------------------------------------------------------------------------------------------
 # Level-up learnsets (wazaoboe_total.bin)
 # ----------------------------------------------------------------------------------------------------------------------
+__WAZAOBOE_ENTRY_STRUCT__ = struct.Struct("<130H")
+__WAZAOBOE_MOVE_STRUCT__ = struct.Struct("<2H")
+
+
 def unpack_wazaoboe(in_file: str, out_file: str) -> None:
     buffer = read_bin_file(in_file)
     len_buffer = len(buffer)
+    pokemon = __CONSTANTS__["pokemon"]
+    moves = __CONSTANTS__["moves"]
 
+    num_entries = len_buffer // 0x104
     entries = dict()
 
-    for i in range(len_buffer // 0x104):
-        moves_list = list()
-        offset = i * 0x104
+    # Each entry consists of 65 pairs of move and level, unused pairs are filled with 0xFFFF
+    for i in range(num_entries):
+        pairs = __WAZAOBOE_ENTRY_STRUCT__.unpack_from(buffer, i * 0x104)
 
-        for j in range(65):
-            move, level = struct.unpack_from("<2H", buffer, offset)
-            offset += 4
+        entries[pokemon[i]] = [{"level": pairs[j + 1], "move": moves[pairs[j]]} for j in range(0, 130, 2)
+                               if pairs[j] != 65535 and pairs[j + 1] != 65535]
+
+    # The JSON text is written by hand to ensure that all move entries are kept on a single line, which makes the output
+    # more appealing to look at. Otherwise, the formatting is the same as json.dump with an indentation of 4.
+    create_parent_dirs(out_file)
 
-            if move != 65535 and level != 65535:
-                moves_list.append({
-                    "level": level,
-                    "move": cnstname("moves", move)
-                })
+    with open(out_file, "w", encoding="utf-8") as f:
+        f.write("{")
+        separator = "\n"
 
-        entries[__CONSTANTS__["pokemon"][i]] = moves_list
+        for pokemon_name, moves_list in entries.items():
+            f.write(f"{separator}    {json.dumps(pokemon_name, ensure_ascii=False)}: ")
+            separator = ",\n"
 
-    # Overriding JSONEncoder.encode is a real mess, so we will have to stay with this ugly solution for now. Basically,
-    # this ensures that all move entries are kept on a single line to make the output more appealing to look at.
-    unpacked_raw = json.dumps(entries, indent=4, ensure_ascii=False).replace("{\n            ", "{ ")
-    unpacked_raw = unpacked_raw.replace(",\n            \"move\"", ", \"move\"")
-    unpacked_raw = unpacked_raw.replace("\n        },\n", " },\n")
-    unpacked_raw = unpacked_raw.replace("\n        }\n", " }\n")
+            if moves_list:
+                move_lines = ",\n".join(f"        {{ \"level\": {move['level']}, "
+                                         f"\"move\": {json.dumps(move['move'], ensure_ascii=False)} }}"
+                                         for move in moves_list)
+                f.write(f"[\n{move_lines}\n    ]")
+            else:
+                f.write("[]")
 
-    with open(out_file, "w", encoding="utf-8") as f:
-        f.write(unpacked_raw)
-        f.flush()
+        f.write("\n}" if entries else "}")
 
 
 def pack_wazaoboe(in_file: str, out_file: str) -> None:
     entries = read_json_file(in_file)
-    buffer = bytearray(len(__CONSTANTS__["pokemon"]) * 0x104 * [0xFF])
+    pokemon_idx = __CONSTANTS_IDX__["pokemon"]
+    moves_idx = __CONSTANTS_IDX__["moves"]
+    buffer = bytearray(b"\xFF") * (len(pokemon_idx) * 0x104)
 
     for pokemon_name, move_list in entries.items():
-        offset = cnstval("pokemon", pokemon_name) * 0x104
+        offset = pokemon_idx[pokemon_name] * 0x104
         num_entries = len(move_list)
 
         if num_entries > 65:
@@ -287,7 +389,7 @@ def pack_wazaoboe(in_file: str, out_file: str) -> None:
 
         for i in range(num_entries):
             entry = move_list[i]
-            struct.pack_into("<2H", buffer, offset, cnstval("moves", entry["move"]), entry["level"])
+            __WAZAOBOE_MOVE_STRUCT__.pack_into(buffer, offset, moves_idx[entry["move"]], entry["level"])
             offset += 4
 
     write_bin_file(out_file, buffer)
@@ -296,43 +398,35 @@ def pack_wazaoboe(in_file: str, out_file: str) -> None:
 # ----------------------------------------------------------------------------------------------------------------------
 # pokecaplist.bin -- Pokémon Icon List
 # ----------------------------------------------------------------------------------------------------------------------
-__POKECAPLIST_ENTRY_STRUCT__ = struct.Struct("<3Hx?")
+__POKECAPLIST_ENTRY_FORMAT__ = "3Hx?"
+__POKECAPLIST_ENTRY_STRUCT__ = struct.Struct("<" + __POKECAPLIST_ENTRY_FORMAT__)
 
 
 def unpack_pokecaplist(in_file: str, out_file: str) -> None:
     buffer = read_bin_file(in_file)
-    len_buffer = len(buffer)
-    offset = 0
+    genders = __CONSTANTS__["genders"]
 
-    entries = list()
-
-    while offset < len_buffer:
-        icon_id, form_id, gender_type, is_gigantamax = __POKECAPLIST_ENTRY_STRUCT__.unpack_from(buffer, offset)
-        offset += 8
-
-        entries.append({
-            "icon_id": icon_id,
-            "form_id": form_id,
-            "gender_type": cnstname("genders", gender_type),
-            "is_gigantamax": is_gigantamax
-        })
+    entries = [{
+        "icon_id": icon_id,
+        "form_id": form_id,
+        "gender_type": genders[gender_type],
+        "is_gigantamax": is_gigantamax
+    } for icon_id, form_id, gender_type, is_gigantamax in __POKECAPLIST_ENTRY_STRUCT__.iter_unpack(buffer)]
 
     write_json_file(out_file, entries)
 
 
 def pack_pokecaplist(in_file: str, out_file: str) -> None:
     entries = read_json_file(in_file)
-    buffer = bytearray(len(entries) * 8)
-    offset = 0
+    genders_idx = __CONSTANTS_IDX__["genders"]
+
+    # All entries are packed at once using a format that repeats the entry structure for every entry
+    fields = list()
 
     for entry in entries:
-        icon_id = entry["icon_id"]
-        form_id = entry["form_id"]
-        gender_type = cnstval("genders", entry["gender_type"])
-        is_gigantamax = entry["is_gigantamax"]
+        fields += (entry["icon_id"], entry["form_id"], genders_idx[entry["gender_type"]], entry["is_gigantamax"])
 
-        __POKECAPLIST_ENTRY_STRUCT__.pack_into(buffer, offset, icon_id, form_id, gender_type, is_gigantamax)
-        offset += 8
+    buffer = struct.pack("<" + __POKECAPLIST_ENTRY_FORMAT__ * len(entries), *fields)
 
     write_bin_file(out_file, buffer)
 